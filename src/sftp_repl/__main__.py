@@ -1,22 +1,33 @@
 import fnmatch
+import functools
 import getpass
 import glob
+import itertools
+import os
+import posixpath
+import re
 import shlex
+import stat
 import sys
+import threading
+import time
 from argparse import ArgumentParser, ArgumentError
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePath
-from tempfile import TemporaryDirectory
-from typing import Sequence, Iterable
+from typing import TYPE_CHECKING, Annotated, Callable, Iterator, Sequence, Iterable
 
 import typer
 from paramiko.client import WarningPolicy
+from paramiko.sftp import CMD_EXTENDED, int64
 from paramiko.sftp_attr import SFTPAttributes
 from paramiko.sftp_client import SFTPClient
+from paramiko.sftp_file import SFTPFile
 from pydantic import TypeAdapter
 from paramiko import SSHClient
 from rich.columns import Columns
 from rich.console import Console
-from rich.progress import Progress
+from rich.text import Text
 
 from sftp_repl.completions import (
     is_dir,
@@ -24,8 +35,12 @@ from sftp_repl.completions import (
     configure_readline,
     readline,
 )
+from sftp_repl.pool import SftpClientPool, absolute_remote_path, open_sftp
 from sftp_repl.utils import format_name, long_listing, SftpUrl, handle_io_error
 
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
 app = typer.Typer()
 console = Console()
 
@@ -49,165 +64,730 @@ def parse_args(parser, args: Sequence[str]):
     return args
 
 
+def _directory_attr() -> SFTPAttributes:
+    sftp_attr = SFTPAttributes()
+    sftp_attr.st_mode = stat.S_IFDIR
+    return sftp_attr
+
+
+Listings = dict[str, list[SFTPAttributes]]
+
+
+def _listdir(
+    sftp_client: SFTPClient, path: str, listings: Listings
+) -> list[SFTPAttributes]:
+    if path not in listings:
+        # paramiko's listdir_iter reads its pipelined READDIR responses
+        # straight off the channel, so the listing has to be drained before
+        # any other request is made on this client
+        listings[path] = list(sftp_client.listdir_iter(path))
+    return listings[path]
+
+
+# directories whose listings are requested at once while expanding a glob
+GLOB_LISTING_BATCH = 16
+
+
+def _prefetch_listings(
+    sftp_client: SFTPClient,
+    pool: SftpClientPool | None,
+    paths: list[str],
+    listings: Listings,
+):
+    """List ``paths`` concurrently on the pool's sessions into ``listings``.
+
+    Failed listings are left out, so the error is raised in order when
+    ``_listdir`` asks for that directory again.
+    """
+    if pool is None or len(paths) < 2 or not pool.warm():
+        return
+
+    def _list(path: str) -> list[SFTPAttributes] | None:
+        def operation(client: SFTPClient) -> list[SFTPAttributes]:
+            return list(client.listdir_iter(absolute_remote_path(sftp_client, path)))
+
+        try:
+            return pool.run(operation)
+        except IOError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        for path, attrs in zip(paths, executor.map(_list, paths)):
+            if attrs is not None:
+                listings[path] = attrs
+
+
+def _join(directory: str, name: str) -> str:
+    # spelled the way PurePath would, since listings are keyed by str(path)
+    return name if directory == "." else posixpath.join(directory, name)
+
+
 def search_glob(
-    sftp_client: SFTPClient, current_dir: PurePath, glob_parts: Sequence[str]
-) -> list[tuple[PurePath, SFTPAttributes]]:
-    if not glob_parts:
-        return [(current_dir, sftp_client.stat(str(current_dir)))]
-    if glob_parts[0] == "..":
-        return search_glob(sftp_client, current_dir / "..", glob_parts[1:])
-
-    matching_files = []
-    files = sftp_client.listdir_attr(str(current_dir))
-    for file in files:
-        if fnmatch.fnmatch(file.filename, glob_parts[0]):
-            if len(glob_parts) == 1:
-                matching_files.append((current_dir / file.filename, file))
-            else:
-                matching_files.extend(
-                    search_glob(
-                        sftp_client, current_dir / file.filename, glob_parts[1:]
-                    )
-                )
-    return matching_files
+    sftp_client: SFTPClient,
+    start: PurePath,
+    glob_parts: Sequence[str],
+    listings: Listings,
+    pool: SftpClientPool | None = None,
+) -> Iterator[tuple[PurePath, SFTPAttributes]]:
+    # paths are handled as strings until they are yielded, joining PurePaths
+    # for every directory entry costs more than the listing itself
+    pending = deque([(str(start), tuple(glob_parts))])
+    while pending:
+        batch = [
+            pending.popleft() for _ in range(min(len(pending), GLOB_LISTING_BATCH))
+        ]
+        _prefetch_listings(
+            sftp_client,
+            pool,
+            [
+                current_dir
+                for current_dir, parts in batch
+                if parts and parts[0] != ".." and current_dir not in listings
+            ],
+            listings,
+        )
+        for current_dir, parts in batch:
+            if not parts:
+                # only reached for the working directory or a ".." of a listed
+                # directory, both known to be directories, so skip the stat
+                yield PurePath(current_dir), _directory_attr()
+                continue
+            if parts[0] == "..":
+                pending.append((_join(current_dir, ".."), parts[1:]))
+                continue
+
+            matches = _part_matcher(parts[0])
+            for file in _listdir(sftp_client, current_dir, listings):
+                if matches(file.filename):
+                    if len(parts) == 1:
+                        yield PurePath(_join(current_dir, file.filename)), file
+                    else:
+                        pending.append((_join(current_dir, file.filename), parts[1:]))
+
+
+def _has_magic(part: str) -> bool:
+    return any(c in part for c in "*?[")
+
+
+@functools.lru_cache(maxsize=256)
+def _part_matcher(part: str) -> Callable[[str], object]:
+    """Match file names against one path part, translating globs only once."""
+    if not _has_magic(part):
+        return part.__eq__
+    return re.compile(fnmatch.translate(part)).match
 
 
 def expand_path_globs(
-    paths: Iterable[PurePath], sftp_client: SFTPClient
-) -> list[tuple[PurePath, SFTPAttributes]]:
-    matching_files = []
+    paths: Iterable[PurePath],
+    sftp_client: SFTPClient,
+    listings: Listings | None = None,
+    pool: SftpClientPool | None = None,
+) -> Iterator[tuple[PurePath, SFTPAttributes]]:
+    """Expand the globs in ``paths`` to the matching files and their attributes.
+
+    Directory listings are kept in ``listings`` so that each directory is only
+    read once per command, however many of the paths pass through it. With a
+    ``pool``, sibling directories are listed concurrently.
+    """
+    if listings is None:
+        listings = {}
     for path in paths:
-        matching_files.extend(
-            search_glob(sftp_client, PurePath(path.root or "."), path.parts)
-        )
-    return matching_files
+        parts = path.parts
+        # parts before the first wildcard name a single path, so jump straight
+        # there instead of listing every directory along the way
+        literal = next((i for i, p in enumerate(parts) if _has_magic(p)), len(parts))
+        if literal == len(parts) and parts:
+            if str(path) in listings:
+                # listed already, so it's a directory and the stat can go
+                yield path, _directory_attr()
+                continue
+            try:
+                yield path, sftp_client.lstat(str(path))
+            except IOError:
+                pass
+            continue
+        base = PurePath(*parts[:literal]) if literal else PurePath(".")
+        yield from search_glob(sftp_client, base, parts[literal:], listings, pool)
 
 
-def ls(sftp_client: SFTPClient, *args):
-    """List files in the specified directory."""
-    parser = ArgumentParser("ls", add_help=False, exit_on_error=False)
-    parser.add_argument(
-        "paths", nargs="*", default=[PurePath(".")], type=PurePath, help="Path to list"
-    )
-    parser.add_argument("--help", action="store_true", help="Show")
-    parser.add_argument(
-        "-l", action="store_true", dest="long", help="Long listing format"
-    )
-    parser.add_argument(
-        "-h", action="store_true", dest="human", help="Human readable sizes"
-    )
-    args = parse_args(parser, args)
+_LS_PARSER = ArgumentParser("ls", add_help=False, exit_on_error=False)
+_LS_PARSER.add_argument(
+    "paths", nargs="*", default=[PurePath(".")], type=PurePath, help="Path to list"
+)
+_LS_PARSER.add_argument("--help", action="store_true", help="Show")
+_LS_PARSER.add_argument(
+    "-l", action="store_true", dest="long", help="Long listing format"
+)
+_LS_PARSER.add_argument(
+    "-h", action="store_true", dest="human", help="Human readable sizes"
+)
+_LS_PARSER.add_argument(
+    "-U",
+    "--no-sort",
+    action="store_false",
+    dest="sort",
+    help="Do not sort; list entries in directory order",
+)
 
-    try:
-        matching_files = expand_path_globs(args.paths, sftp_client)
-        multi = len(matching_files) > 1
+
+def ls(sftp_client: SFTPClient, *args, pool: SftpClientPool | None = None):
+    """List files in the specified directory."""
+    args = parse_args(_LS_PARSER, args)
+
+    with handle_io_error(console):
+        listings: Listings = {}
+        if args.sort and len(args.paths) == 1:
+            _list_lone_path(sftp_client, args.paths[0], listings)
+        matches = expand_path_globs(args.paths, sftp_client, listings, pool)
+        # two matches are enough to know whether to print directory headers
+        head = list(itertools.islice(matches, 2))
+        multi = len(head) > 1
+        matching_files = itertools.chain(head, matches)
+        if args.sort:
+            matching_files = sorted(matching_files, key=_match_sort_key)
+            # with every match known, the directories still to be shown are
+            # listed together rather than one round trip after another
+            _prefetch_listings(
+                sftp_client,
+                pool,
+                [
+                    str(path)
+                    for path, sftp_attr in matching_files
+                    if is_dir(sftp_attr) and str(path) not in listings
+                ],
+                listings,
+            )
+        else:
+            matching_files = _files_first(matching_files)
         prev_listing = False
-        for path, sftp_attr in sorted(
-            matching_files, key=lambda pf: (is_dir(pf[1]), str(pf[0]).lower())
-        ):
+        # unsorted files are shown as the globs are expanded, directories after
+        for path, sftp_attr in matching_files:
             if is_dir(sftp_attr):
-                attrs = sftp_client.listdir_attr(str(path))
+                if str(path) in listings:
+                    attrs = listings[str(path)]
+                else:
+                    attrs = sftp_client.listdir_iter(str(path), read_aheads=50)
+                files = ((a.filename, a) for a in attrs)
                 if multi:
-                    files = [(a.filename, a) for a in attrs]
                     console.print(
                         f"{'\n' if prev_listing else ''}[bold cyan]{path}[/bold cyan]:",
                         highlight=False,
                     )
-                else:
-                    files = [(a.filename, a) for a in attrs]
+                _list_files(files, args.human, args.long, args.sort)
             else:
-                files = [(str(path), sftp_attr)]
-
-            _list_files(files, args.human, args.long)
+                # a single entry, nothing to sort
+                _list_files([(str(path), sftp_attr)], args.human, args.long, False)
             prev_listing = True
 
-    except IOError as ex:
-        console.print(f"[red]{ex}[/red]")
 
+# long listing lines rendered by each console.print
+LONG_LISTING_BATCH = 512
+
+
+def _list_lone_path(sftp_client: SFTPClient, path: PurePath, listings: Listings):
+    """List a single path without wildcards before knowing what it is.
+
+    A directory then takes one round trip instead of an lstat and a listing,
+    while a file or a missing path costs a failed listing on top of the
+    lstat. Sorted output reads the whole listing before showing it anyway;
+    with several paths the directories are listed together later instead.
+    """
+    if not path.parts or any(_has_magic(part) for part in path.parts):
+        return
+    try:
+        _listdir(sftp_client, str(path), listings)
+    except IOError:
+        # not a directory, or missing, which the lstat tells apart
+        pass
+
+
+def _files_first(
+    matches: Iterable[tuple[PurePath, SFTPAttributes]],
+) -> Iterator[tuple[PurePath, SFTPAttributes]]:
+    """Pass file matches straight through, holding directories back to the end.
+
+    Files are shown without a header, so one shown after a directory listing
+    would read as part of it. Sorted output puts files first for the same
+    reason, and so does GNU ls -U.
+    """
+    directories = []
+    for match in matches:
+        if is_dir(match[1]):
+            directories.append(match)
+        else:
+            yield match
+    yield from directories
 
-def _list_files(files: list[tuple[str, SFTPAttributes]], human: bool, long: bool):
+
+def _match_sort_key(match: tuple[PurePath, SFTPAttributes]) -> tuple[bool, str]:
+    path, sftp_attr = match
+    return is_dir(sftp_attr), str(path).lower()
+
+
+def _name_sort_key(entry: tuple[str, SFTPAttributes]) -> str:
+    return entry[0].lower()
+
+
+def _list_files(
+    files: Iterable[tuple[str, SFTPAttributes]], human: bool, long: bool, sort: bool
+):
+    if sort:
+        files = sorted(files, key=_name_sort_key)
     if long:
-        for name, file in sorted(
-            files,
-            key=lambda f: f[0].lower(),
-        ):
-            console.print(
-                long_listing(name, file, human_readable=human),
-                highlight=False,
-            )
+        now = time.time()
+        lines = (
+            long_listing(name, file, human_readable=human, now=now)
+            for name, file in files
+        )
+        # each print is a full render and flush, so lines go out in batches;
+        # unsorted entries still show up as they arrive from the server
+        for batch in itertools.batched(lines, LONG_LISTING_BATCH):
+            console.print(Text("\n").join(batch), highlight=False)
     else:
-        formatted_files = [
-            format_name(name, f)
-            for name, f in sorted(files, key=lambda f: f[0].lower())
-        ]
+        formatted_files = [format_name(name, f) for name, f in files]
         console.print(Columns(formatted_files))
 
 
+_CD_PARSER = ArgumentParser("cd", add_help=False, exit_on_error=False)
+_CD_PARSER.add_argument("path", help="Path to change to")
+_CD_PARSER.add_argument("--help", action="store_true", help="Show")
+
+
 @handle_io_error(console)
 def cd(sftp_client: SFTPClient, *args):
-    parser = ArgumentParser("cd", add_help=False, exit_on_error=False)
-    parser.add_argument("path", help="Path to change to")
-    parser.add_argument("--help", action="store_true", help="Show")
-    args = parse_args(parser, args)
+    args = parse_args(_CD_PARSER, args)
 
     sftp_client.chdir(args.path)
 
 
+TransferCallback = Callable[[int, int], None]
+
+# bytes moved per read/write call between the local and the remote file
+TRANSFER_CHUNK_SIZE = 256 * 1024
+
+# minimum seconds between forced progress bar redraws during a transfer
+PROGRESS_REFRESH_INTERVAL = 0.05
+
+
+def _run_transfer(
+    progress: "Progress",
+    description: str,
+    transfer: Callable[[TransferCallback], object],
+):
+    task = progress.add_task(description)
+
+    update_called = False
+    last_refresh = 0.0
+
+    def _update(current, total):
+        # for empty files
+        nonlocal update_called, last_refresh
+        update_called = True
+        if total == 0:
+            total, current = 1, 1
+        # paramiko calls back for every block, so only force a redraw a few
+        # times per second and leave the rest to the progress auto refresh
+        now = time.monotonic()
+        refresh = current == total or now - last_refresh >= PROGRESS_REFRESH_INTERVAL
+        if refresh:
+            last_refresh = now
+        progress.update(task, completed=current, total=total, refresh=refresh)
+
+    transfer(_update)
+
+    if not update_called:
+        progress.update(task, completed=1, total=1, refresh=True)
+
+
+def _map_pooled(
+    sftp_client: SFTPClient,
+    pool: SftpClientPool | None,
+    operations: Iterable[tuple[str, Callable[[SFTPClient], object]]],
+):
+    """Call each ``(path, operation)`` pair's operation with an SFTP client.
+
+    When there is more than one operation and a pool with a session to offer,
+    they are spread across the pool's sessions and run concurrently.
+    Otherwise they run one after another on ``sftp_client``. Either way a
+    failed operation is reported with its path and the rest still run.
+    """
+    operations = iter(operations)
+    head = list(itertools.islice(operations, 2))
+    if pool is None or len(head) < 2 or not pool.warm():
+        for path, operation in itertools.chain(head, operations):
+            with handle_io_error(console, path):
+                operation(sftp_client)
+        return
+
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        futures = [
+            (path, executor.submit(pool.run, operation))
+            for path, operation in itertools.chain(head, operations)
+        ]
+        for path, future in futures:
+            with handle_io_error(console, path):
+                future.result()
+
+
+def _claim_destination(destinations: dict[str, str], dst: str, src: str) -> bool:
+    """Record ``dst`` as written from ``src``, unless another source got it first.
+
+    Transfers run concurrently, so two of them writing one file would
+    interleave their data. The later source is reported and left out instead.
+    """
+    if dst in destinations:
+        console.print(
+            f"[red]{src} skipped, {dst} is already written from {destinations[dst]}"
+        )
+        return False
+    destinations[dst] = src
+    return True
+
+
+def _run_transfers(
+    sftp_client: SFTPClient,
+    pool: SftpClientPool | None,
+    transfers: list[tuple[str, str, Callable[[SFTPClient, TransferCallback], object]]],
+):
+    """Run each ``(path, description, transfer)`` triple with a progress bar."""
+    # only transfers draw progress bars, keep it off the startup path
+    from rich.progress import Progress
+
+    with Progress() as progress:
+
+        def _transfer(description, transfer, client):
+            _run_transfer(progress, description, functools.partial(transfer, client))
+
+        _map_pooled(
+            sftp_client,
+            pool,
+            (
+                (path, functools.partial(_transfer, description, transfer))
+                for path, description, transfer in transfers
+            ),
+        )
+
+
+_GET_PARSER = ArgumentParser("get", add_help=False, exit_on_error=False)
+_GET_PARSER.add_argument("src", type=PurePath, help="source path")
+_GET_PARSER.add_argument(
+    "dst", type=Path, nargs="?", default=Path("."), help="destination path"
+)
+_GET_PARSER.add_argument("--help", action="store_true", help="Show")
+_GET_PARSER.add_argument(
+    "--max-prefetch",
+    "--max-requests",
+    type=int,
+    default=64,
+    help="Maximum number of concurrent prefetch read requests",
+)
+_GET_PARSER.add_argument(
+    "--no-prefetch",
+    action="store_false",
+    dest="prefetch",
+    help="Disable prefetching of file contents",
+)
+_GET_PARSER.add_argument(
+    "--block-size",
+    type=int,
+    default=None,
+    help="Bytes per SFTP read request",
+)
+
+
 @handle_io_error(console)
-def get(sftp_client: SFTPClient, *args):
-    parser = ArgumentParser("get", add_help=False, exit_on_error=False)
-    parser.add_argument("src", type=Path, help="source path")
-    parser.add_argument(
-        "dst", type=Path, nargs="?", default=Path("."), help="destination path"
-    )
-    parser.add_argument("--help", action="store_true", help="Show")
-    args = parse_args(parser, args)
+def get(sftp_client: SFTPClient, *args, pool: SftpClientPool | None = None):
+    args = parse_args(_GET_PARSER, args)
 
-    matching_files = expand_path_globs([args.src], sftp_client)
+    matching_files = list(expand_path_globs([args.src], sftp_client, pool=pool))
 
     if not matching_files:
         console.print(f"[red]File {args.src} not found")
         return
 
-    if len(matching_files) > 1 and not args.dst.is_dir():
+    dst_is_dir = args.dst.is_dir()
+    if len(matching_files) > 1 and not dst_is_dir:
         console.print(f"[red]{args.dst}: Not a directory")
         return
 
+    # with nothing else to run concurrently, a large file is split instead
+    stripe = pool is not None and len(matching_files) == 1 and args.prefetch
+    transfers = []
+    destinations = {}
     for src, src_attrs in matching_files:
         if is_dir(src_attrs):
             console.print(f"[red]{src} is a directory")
             continue
 
-        with Progress() as progress:
-            dst_name = args.dst / src.name if args.dst.is_dir() else args.dst
-            task = progress.add_task(
-                f"[cyan]Fetching {src} to {dst_name}[/cyan]",
+        dst_name = args.dst / src.name if dst_is_dir else args.dst
+        if not _claim_destination(destinations, str(dst_name), str(src)):
+            continue
+        remotepath = absolute_remote_path(sftp_client, src)
+        file_size = _target_size(src_attrs)
+        if stripe and file_size is None:
+            # striping needs the size up front, so stat the link's target
+            file_size = sftp_client.stat(remotepath).st_size
+        if stripe and (file_size or 0) >= STRIPE_MIN_SIZE and pool.warm():
+            transfer = functools.partial(
+                _get_file_striped,
+                remotepath,
+                str(dst_name),
+                file_size,
+                pool,
+                max_concurrent_prefetch_requests=args.max_prefetch,
+                block_size=args.block_size,
             )
+        else:
+            transfer = functools.partial(
+                _get_file,
+                remotepath,
+                str(dst_name),
+                file_size,
+                prefetch=args.prefetch,
+                max_concurrent_prefetch_requests=args.max_prefetch,
+                block_size=args.block_size,
+            )
+        transfers.append(
+            (str(src), f"[cyan]Fetching {src} to {dst_name}[/cyan]", transfer)
+        )
 
-            update_called = False
+    if transfers:
+        _run_transfers(sftp_client, pool, transfers)
 
-            def _update(current, total):
-                # for empty files
-                nonlocal update_called
-                update_called = True
-                if total == 0:
-                    total, current = 1, 1
-                progress.update(task, completed=current, total=total, refresh=True)
 
-            sftp_client.get(str(src), str(dst_name), callback=_update)
+def _target_size(sftp_attr: SFTPAttributes) -> int | None:
+    """Size of the file behind listing or lstat attributes, if they tell it.
 
-            if not update_called:
-                progress.update(task, completed=1, total=1, refresh=True)
+    For a symlink those attributes describe the link itself, whose size is
+    the length of the path it points to, so ``None`` is returned instead.
+    """
+    if sftp_attr.st_mode is not None and stat.S_ISLNK(sftp_attr.st_mode):
+        return None
+    return sftp_attr.st_size
 
 
-def put(sftp_client: SFTPClient, *args):
-    parser = ArgumentParser("put", add_help=False, exit_on_error=False)
-    parser.add_argument("src", type=str, help="source path")
-    parser.add_argument(
-        "dst", type=PurePath, nargs="?", default=PurePath("."), help="destination path"
-    )
-    parser.add_argument("--help", action="store_true", help="Show")
-    args = parse_args(parser, args)
+def _preallocate(fd: int, size: int):
+    """Reserve ``size`` bytes for a local file, so it isn't fragmented as it grows."""
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            # not every filesystem supports it, the writes allocate instead
+            pass
+
+
+def _get_file(
+    remotepath: str,
+    localpath: str,
+    file_size: int | None,
+    sftp_client: SFTPClient,
+    callback: TransferCallback,
+    prefetch: bool = True,
+    max_concurrent_prefetch_requests: int | None = None,
+    block_size: int | None = None,
+):
+    """Download a file whose size is already known from the glob listing.
+
+    Same as ``SFTPClient.get`` but without its extra stat of the remote file,
+    and reading the prefetched data back in larger chunks.
+    """
+    if file_size is None:
+        file_size = sftp_client.stat(remotepath).st_size
+
+    size = 0
+    with sftp_client.open(remotepath, "rb") as fr, open(localpath, "wb") as fl:
+        if block_size:
+            fr.MAX_REQUEST_SIZE = block_size
+        if prefetch:
+            fr.prefetch(file_size, max_concurrent_prefetch_requests)
+        _preallocate(fl.fileno(), file_size)
+        try:
+            while data := fr.read(TRANSFER_CHUNK_SIZE):
+                fl.write(data)
+                size += len(data)
+                callback(size, file_size)
+        finally:
+            if size != file_size:
+                # don't leave preallocated space past what was actually read,
+                # or a failed download would look complete
+                fl.truncate(size)
+
+    if size != file_size:
+        raise IOError(f"size mismatch in get!  {size} != {file_size}")
+
+
+def _put_file(
+    localpath: str,
+    remotepath: str,
+    sftp_client: SFTPClient,
+    callback: TransferCallback,
+    block_size: int | None = None,
+):
+    """Upload a file with pipelined writes.
+
+    Same as ``SFTPClient.put`` but reading the local file into one reused
+    buffer, in larger chunks.
+    """
+    file_size = os.stat(localpath).st_size
+    buffer = memoryview(bytearray(TRANSFER_CHUNK_SIZE))
+
+    size = 0
+    with open(localpath, "rb") as fl, sftp_client.open(remotepath, "wb") as fr:
+        if block_size:
+            fr.MAX_REQUEST_SIZE = block_size
+        # don't wait for the server to acknowledge each write before the next
+        fr.set_pipelined(True)
+        while n := fl.readinto(buffer):
+            fr.write(buffer[:n])
+            size += n
+            callback(size, file_size)
+
+    remote_size = sftp_client.stat(remotepath).st_size
+    if remote_size != size:
+        raise IOError(f"size mismatch in put!  {remote_size} != {size}")
+
+
+# a lone file at least this large is split into ranges transferred on every
+# session of the pool at once
+STRIPE_MIN_SIZE = 16 * 1024 * 1024
+
+
+def _run_striped(
+    pool: SftpClientPool,
+    file_size: int,
+    callback: TransferCallback,
+    transfer_stripe: Callable[[int, int, Callable[[int], None], SFTPClient], int],
+) -> int:
+    """Split ``file_size`` bytes into one range per session and transfer each.
+
+    ``transfer_stripe(offset, length, advance, client)`` moves one range,
+    calling ``advance`` with each amount moved, and returns the bytes moved.
+    The total of all ranges is returned.
+    """
+    lock = threading.Lock()
+    done = 0
+
+    def _advance(n: int):
+        nonlocal done
+        with lock:
+            done += n
+            callback(done, file_size)
+
+    stripe = -(-file_size // pool.size)
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        futures = [
+            executor.submit(
+                pool.run,
+                functools.partial(
+                    transfer_stripe,
+                    offset,
+                    min(stripe, file_size - offset),
+                    _advance,
+                ),
+            )
+            for offset in range(0, file_size, stripe)
+        ]
+        size = sum(future.result() for future in futures)
+    return size
+
+
+def _get_file_striped(
+    remotepath: str,
+    localpath: str,
+    file_size: int,
+    pool: SftpClientPool,
+    sftp_client: SFTPClient,
+    callback: TransferCallback,
+    max_concurrent_prefetch_requests: int | None = None,
+    block_size: int | None = None,
+):
+    """Download one large file in ranges, each on its own pooled session."""
+
+    def _get_stripe(offset, length, advance, client: SFTPClient) -> int:
+        chunks = [
+            (start, min(TRANSFER_CHUNK_SIZE, offset + length - start))
+            for start in range(offset, offset + length, TRANSFER_CHUNK_SIZE)
+        ]
+        size = 0
+        with client.open(remotepath, "rb") as fr:
+            if block_size:
+                fr.MAX_REQUEST_SIZE = block_size
+            for (start, _), data in zip(
+                chunks, fr.readv(chunks, max_concurrent_prefetch_requests)
+            ):
+                os.pwrite(fl.fileno(), data, start)
+                size += len(data)
+                advance(len(data))
+        return size
+
+    with open(localpath, "wb") as fl:
+        # ranges land out of order, reserving the space keeps the file whole
+        _preallocate(fl.fileno(), file_size)
+        try:
+            size = _run_striped(pool, file_size, callback, _get_stripe)
+            if size != file_size:
+                raise IOError(f"size mismatch in get!  {size} != {file_size}")
+        except BaseException:
+            # a missing range can be anywhere in the file, so no part of it
+            # is worth keeping
+            fl.truncate(0)
+            raise
+
+
+def _put_file_striped(
+    localpath: str,
+    remotepath: str,
+    file_size: int,
+    pool: SftpClientPool,
+    sftp_client: SFTPClient,
+    callback: TransferCallback,
+    block_size: int | None = None,
+):
+    """Upload one large file in ranges, each on its own pooled session."""
+
+    def _put_stripe(offset, length, advance, client: SFTPClient) -> int:
+        buffer = memoryview(bytearray(TRANSFER_CHUNK_SIZE))
+        size = 0
+        with open(localpath, "rb") as fl, client.open(remotepath, "r+b") as fr:
+            if block_size:
+                fr.MAX_REQUEST_SIZE = block_size
+            fr.set_pipelined(True)
+            fl.seek(offset)
+            fr.seek(offset)
+            while size < length and (
+                n := fl.readinto(buffer[: min(TRANSFER_CHUNK_SIZE, length - size)])
+            ):
+                fr.write(buffer[:n])
+                size += n
+                advance(n)
+        return size
+
+    # create or truncate the file once, the stripes then write into it
+    sftp_client.open(remotepath, "wb").close()
+    size = _run_striped(pool, file_size, callback, _put_stripe)
+
+    remote_size = sftp_client.stat(remotepath).st_size
+    if remote_size != size:
+        raise IOError(f"size mismatch in put!  {remote_size} != {size}")
+
+
+_PUT_PARSER = ArgumentParser("put", add_help=False, exit_on_error=False)
+_PUT_PARSER.add_argument("src", type=str, help="source path")
+_PUT_PARSER.add_argument(
+    "dst", type=PurePath, nargs="?", default=PurePath("."), help="destination path"
+)
+_PUT_PARSER.add_argument("--help", action="store_true", help="Show")
+_PUT_PARSER.add_argument(
+    "--block-size",
+    type=int,
+    default=None,
+    help="Bytes per SFTP write request",
+)
+
+
+@handle_io_error(console)
+def put(sftp_client: SFTPClient, *args, pool: SftpClientPool | None = None):
+    args = parse_args(_PUT_PARSER, args)
 
     matching_files = glob.glob(args.src)
     if not matching_files:
@@ -219,90 +799,123 @@ def put(sftp_client: SFTPClient, *args):
     except IOError:
         dst_attr = None
 
-    if len(matching_files) > 1 and (dst_attr is None or not is_dir(dst_attr)):
+    dst_is_dir = dst_attr is not None and is_dir(dst_attr)
+    if len(matching_files) > 1 and not dst_is_dir:
         console.print(f"[red]{args.dst}: Not a directory")
         return
 
+    # with nothing else to run concurrently, a large file is split instead
+    stripe = pool is not None and len(matching_files) == 1
+    transfers = []
+    destinations = {}
     for src in matching_files:
         src_path = Path(src)
-        with Progress() as progress:
-            dst_name = (
-                args.dst / src_path.name if dst_attr and is_dir(dst_attr) else args.dst
+        dst_name = args.dst / src_path.name if dst_is_dir else args.dst
+        if not _claim_destination(destinations, str(dst_name), src):
+            continue
+        remotepath = absolute_remote_path(sftp_client, dst_name)
+        file_size = os.stat(src).st_size if stripe else 0
+        if file_size >= STRIPE_MIN_SIZE and pool.warm():
+            transfer = functools.partial(
+                _put_file_striped,
+                src,
+                remotepath,
+                file_size,
+                pool,
+                block_size=args.block_size,
             )
-            task = progress.add_task(
-                f"[cyan]Uploading {src} to {dst_name}[/cyan]",
+        else:
+            transfer = functools.partial(
+                _put_file, src, remotepath, block_size=args.block_size
             )
+        transfers.append((src, f"[cyan]Uploading {src} to {dst_name}[/cyan]", transfer))
 
-            update_called = False
-
-            def _update(current, total):
-                # for empty files
-                nonlocal update_called
-                update_called = True
-                if total == 0:
-                    total, current = 1, 1
-                progress.update(task, completed=current, total=total, refresh=True)
+    _run_transfers(sftp_client, pool, transfers)
 
-            sftp_client.put(str(src), str(dst_name), callback=_update)
 
-            if not update_called:
-                progress.update(task, completed=1, total=1, refresh=True)
+_RM_PARSER = ArgumentParser("rm", add_help=False, exit_on_error=False)
+_RM_PARSER.add_argument("paths", nargs="+", type=PurePath, help="Path to list")
+_RM_PARSER.add_argument("--help", action="store_true", help="Show")
 
 
 @handle_io_error(console)
-def rm(sftp_client: SFTPClient, *args):
-    parser = ArgumentParser("rm", add_help=False, exit_on_error=False)
-    parser.add_argument("paths", nargs="+", type=PurePath, help="Path to list")
-    parser.add_argument("--help", action="store_true", help="Show")
+def rm(sftp_client: SFTPClient, *args, pool: SftpClientPool | None = None):
+    args = parse_args(_RM_PARSER, args)
 
-    args = parse_args(parser, args)
+    def _removals():
+        for path, sftp_attr in expand_path_globs(args.paths, sftp_client, pool=pool):
+            if is_dir(sftp_attr):
+                console.print(f"[red]{path}: is a directory[/red]")
+                return
+            yield str(path), functools.partial(
+                _remove_file, absolute_remote_path(sftp_client, path)
+            )
 
-    matching_files = expand_path_globs(args.paths, sftp_client)
-    for path, sftp_attr in matching_files:
-        if is_dir(sftp_attr):
-            console.print(f"[red]{path}: is a directory[/red]")
-            return
-        sftp_client.remove(str(path))
+    _map_pooled(sftp_client, pool, _removals())
 
 
-@handle_io_error(console)
-def rmdir(sftp_client: SFTPClient, *args):
-    parser = ArgumentParser("rmdir", add_help=False, exit_on_error=False)
-    parser.add_argument("directories", nargs="+", type=PurePath, help="Path to list")
-    parser.add_argument("--help", action="store_true", help="Show")
+def _remove_file(path: str, sftp_client: SFTPClient):
+    sftp_client.remove(path)
+
+
+_RMDIR_PARSER = ArgumentParser("rmdir", add_help=False, exit_on_error=False)
+_RMDIR_PARSER.add_argument("directories", nargs="+", type=PurePath, help="Path to list")
+_RMDIR_PARSER.add_argument("--help", action="store_true", help="Show")
 
-    args = parse_args(parser, args)
 
-    matching_files = expand_path_globs(args.directories, sftp_client)
-    for path, sftp_attr in matching_files:
+@handle_io_error(console)
+def rmdir(sftp_client: SFTPClient, *args, pool: SftpClientPool | None = None):
+    args = parse_args(_RMDIR_PARSER, args)
+
+    by_depth: dict[int, list[tuple[str, str]]] = {}
+    for path, sftp_attr in expand_path_globs(args.directories, sftp_client, pool=pool):
         if not is_dir(sftp_attr):
             console.print(f"[red]{path}: Not a directory[/red]")
-            return
-        sftp_client.rmdir(str(path))
+            break
+        remotepath = absolute_remote_path(sftp_client, path)
+        by_depth.setdefault(remotepath.count("/"), []).append((str(path), remotepath))
+
+    # directories at one depth can't contain each other, so each level is
+    # removed concurrently, deepest first so nested directories can go too
+    for depth in sorted(by_depth, reverse=True):
+        _map_pooled(
+            sftp_client,
+            pool,
+            [
+                (path, functools.partial(_remove_directory, remotepath))
+                for path, remotepath in by_depth[depth]
+            ],
+        )
+
+
+def _remove_directory(path: str, sftp_client: SFTPClient):
+    sftp_client.rmdir(path)
+
+
+_MKDIR_PARSER = ArgumentParser("mkdir", add_help=False, exit_on_error=False)
+_MKDIR_PARSER.add_argument("directories", nargs="+", type=PurePath, help="Path to list")
+_MKDIR_PARSER.add_argument("--help", action="store_true", help="Show")
 
 
 @handle_io_error(console)
 def mkdir(sftp_client: SFTPClient, *args):
-    parser = ArgumentParser("rmdir", add_help=False, exit_on_error=False)
-    parser.add_argument("directories", nargs="+", type=PurePath, help="Path to list")
-    parser.add_argument("--help", action="store_true", help="Show")
-
-    args = parse_args(parser, args)
+    args = parse_args(_MKDIR_PARSER, args)
 
     for path in args.directories:
         sftp_client.mkdir(str(path))
 
 
-@handle_io_error(console)
-def cp(sftp_client: SFTPClient, *args):
-    parser = ArgumentParser("cp", add_help=False, exit_on_error=False)
-    parser.add_argument("src", type=PurePath, help="Path to list")
-    parser.add_argument("dst", type=PurePath, help="Path to list")
-    parser.add_argument("--help", action="store_true", help="Show")
+_CP_PARSER = ArgumentParser("cp", add_help=False, exit_on_error=False)
+_CP_PARSER.add_argument("src", type=PurePath, help="Path to list")
+_CP_PARSER.add_argument("dst", type=PurePath, help="Path to list")
+_CP_PARSER.add_argument("--help", action="store_true", help="Show")
 
-    args = parse_args(parser, args)
 
-    src_matching_files = expand_path_globs([args.src], sftp_client)
+@handle_io_error(console)
+def cp(sftp_client: SFTPClient, *args, pool: SftpClientPool | None = None):
+    args = parse_args(_CP_PARSER, args)
+
+    src_matching_files = list(expand_path_globs([args.src], sftp_client, pool=pool))
 
     if not src_matching_files:
         console.print(f"[red]File {args.src} not found")
@@ -313,44 +926,150 @@ def cp(sftp_client: SFTPClient, *args):
     except IOError:
         dst_attr = None
 
-    if len(src_matching_files) > 1 and (dst_attr is None or not is_dir(dst_attr)):
+    dst_is_dir = dst_attr is not None and is_dir(dst_attr)
+    if len(src_matching_files) > 1 and not dst_is_dir:
         console.print(f"[red]{args.dst}: Not a directory")
         return
 
-    with TemporaryDirectory() as tmp_dir:
-        tmp_dir_path = Path(tmp_dir)
-        for src_file, sftp_attr in src_matching_files:
-            dst_name = (
-                args.dst / src_file.name if dst_attr and is_dir(dst_attr) else args.dst
+    copies = []
+    destinations = {}
+    for src_file, sftp_attr in src_matching_files:
+        if is_dir(sftp_attr):
+            console.print(f"[red]{src_file} is a directory")
+            continue
+
+        dst_name = args.dst / src_file.name if dst_is_dir else args.dst
+        src_path = posixpath.normpath(absolute_remote_path(sftp_client, src_file))
+        dst_path = posixpath.normpath(absolute_remote_path(sftp_client, dst_name))
+        if src_path == dst_path:
+            # a link back to the source gets past this, _copy_file copes with it
+            console.print(f"[red]{src_file} and {dst_name} are the same file")
+            continue
+        if not _claim_destination(destinations, str(dst_name), str(src_file)):
+            continue
+
+        copies.append(
+            (
+                str(src_file),
+                f"[cyan]Copying {src_file} to {dst_name}[/cyan]",
+                functools.partial(
+                    _copy_file, src_path, dst_path, _target_size(sftp_attr)
+                ),
             )
-            sftp_client.get(str(src_file), str(tmp_dir_path / src_file.name))
-            sftp_client.put(str(tmp_dir_path / src_file.name), str(dst_name))
+        )
+
+    if copies:
+        _run_transfers(sftp_client, pool, copies)
+
+
+def _copy_file(
+    src: str,
+    dst: str,
+    file_size: int | None,
+    sftp_client: SFTPClient,
+    callback: TransferCallback,
+):
+    with sftp_client.open(src, "rb") as fr:
+        if file_size is None:
+            file_size = fr.stat().st_size
+        fw, existed = _open_untruncated(sftp_client, dst)
+        with fw:
+            copied = _copy_data(sftp_client, fr, fw, file_size, callback)
+            if existed:
+                # the source has been read by now, so the old contents can go
+                fw.truncate(copied)
+
+    if copied != file_size:
+        raise IOError(f"size mismatch in cp!  {copied} != {file_size}")
+
+
+def _open_untruncated(sftp_client: SFTPClient, path: str) -> tuple[SFTPFile, bool]:
+    """Open ``path`` for writing without truncating it, creating it if needed.
+
+    A destination reached through a symlink or a hard link can be the source
+    itself, which truncating would empty before it is read. Also returns
+    whether the file already existed, and so still needs truncating.
+    """
+    try:
+        return sftp_client.open(path, "wxb"), False
+    except IOError:
+        return sftp_client.open(path, "r+b"), True
+
+
+def _copy_data(
+    sftp_client: SFTPClient,
+    fr: SFTPFile,
+    fw: SFTPFile,
+    file_size: int,
+    callback: TransferCallback,
+) -> int:
+    try:
+        # "copy-data" extension: the server copies the whole file itself,
+        # a length of 0 means up to the end of the source
+        sftp_client._request(
+            CMD_EXTENDED,
+            "copy-data",
+            fr.handle,
+            int64(0),
+            int64(0),
+            fw.handle,
+            int64(0),
+        )
+        return file_size
+    except IOError:
+        # paramiko drops the extensions advertised by the server, so an
+        # unsupported request is only found out here; stream it instead
+        pass
+    fr.prefetch(file_size)
+    fw.set_pipelined(True)
+    copied = 0
+    while data := fr.read(TRANSFER_CHUNK_SIZE):
+        fw.write(data)
+        copied += len(data)
+        callback(copied, file_size)
+    return copied
+
+
+_MV_PARSER = ArgumentParser("mv", add_help=False, exit_on_error=False)
+_MV_PARSER.add_argument("src", nargs="+", type=PurePath, help="Path to list")
+_MV_PARSER.add_argument("dst", type=PurePath, help="Path to list")
+_MV_PARSER.add_argument("--help", action="store_true", help="Show")
 
 
 @handle_io_error(console)
-def mv(sftp_client: SFTPClient, *args):
-    parser = ArgumentParser("cp", add_help=False, exit_on_error=False)
-    parser.add_argument("src", nargs="+", type=PurePath, help="Path to list")
-    parser.add_argument("dst", type=PurePath, help="Path to list")
-    parser.add_argument("--help", action="store_true", help="Show")
-    args = parse_args(parser, args)
+def mv(sftp_client: SFTPClient, *args, pool: SftpClientPool | None = None):
+    args = parse_args(_MV_PARSER, args)
 
-    src_matching_files = expand_path_globs(args.src, sftp_client)
+    src_matching_files = list(expand_path_globs(args.src, sftp_client, pool=pool))
 
     try:
         dst_attr = sftp_client.stat(str(args.dst))
     except IOError:
         dst_attr = None
 
-    if len(src_matching_files) > 1 and (dst_attr is None or not is_dir(dst_attr)):
+    dst_is_dir = dst_attr is not None and is_dir(dst_attr)
+    if len(src_matching_files) > 1 and not dst_is_dir:
         console.print(f"[red]{args.dst}: Not a directory")
         return
 
+    renames = []
     for src_file, sftp_attr in src_matching_files:
-        dst_name = (
-            args.dst / src_file.name if dst_attr and is_dir(dst_attr) else args.dst
+        dst_name = args.dst / src_file.name if dst_is_dir else args.dst
+        renames.append(
+            (
+                str(src_file),
+                functools.partial(
+                    _rename_file,
+                    absolute_remote_path(sftp_client, src_file),
+                    absolute_remote_path(sftp_client, dst_name),
+                ),
+            )
         )
-        sftp_client.posix_rename(str(src_file), str(dst_name))
+    _map_pooled(sftp_client, pool, renames)
+
+
+def _rename_file(src: str, dst: str, sftp_client: SFTPClient):
+    sftp_client.posix_rename(src, dst)
 
 
 ALIAS = {
@@ -370,13 +1089,36 @@ COMMANDS = {
     "mv": mv,
 }
 
+# handled by the REPL itself, none of them take arguments
+BUILTINS = frozenset({"exit", "quit", "help", "pwd"})
+
+# commands that change the remote files or the working directory, leaving the
+# completion listings stale; the listings expire on their own after a while
+CACHE_INVALIDATING_COMMANDS = frozenset(
+    {"cd", "put", "rm", "rmdir", "mkdir", "cp", "mv"}
+)
+
+# commands that can spread their work across the pool of SFTP sessions
+POOLED_COMMANDS = {
+    "ls": ls,
+    "get": get,
+    "put": put,
+    "rm": rm,
+    "rmdir": rmdir,
+    "cp": cp,
+    "mv": mv,
+}
+
 
-def _repl_main(sftp_client: SFTPClient, url: SftpUrl):
+def _repl_main(sftp_client: SFTPClient, url: SftpUrl, pool: SftpClientPool):
+    commands = COMMANDS | {
+        name: functools.partial(func, pool=pool)
+        for name, func in POOLED_COMMANDS.items()
+    }
     console_interactor = ConsoleInteractor(console, sftp_client, url)
     history_file = configure_readline(console_interactor)
     sftp_client.chdir(url.path or "/")
     while True:
-        console_interactor.clear_cache()
         try:
             user_input = console_interactor.get_input()
         except EOFError:
@@ -388,45 +1130,98 @@ def _repl_main(sftp_client: SFTPClient, url: SftpUrl):
         tokens = shlex.split(user_input.strip())
         if not tokens:
             continue
-        if tokens[0] in ALIAS:
-            tokens = ALIAS[tokens[0]] + tokens[1:]
-
-        match tokens:
-            case ["exit"] | ["quit"]:
-                raise typer.Exit()
-            case ["pwd"]:
-                console.print(f"[bold cyan]{console_interactor.cwd}[/bold cyan]")
-            case [command, *args] if command in COMMANDS:
-                try:
-                    COMMANDS[command](sftp_client, *args)
-                except ParserError:
-                    pass
-            case [command, *_] if command in {"exit", "quit", "help", "pwd"}:
-                console.print(f"[red]{command}: too many args[/red]")
-            case _:
-                console.print(f"Unrecognized command: {user_input}")
+        command, *args = ALIAS.get(tokens[0], tokens[:1]) + tokens[1:]
+
+        func = commands.get(command)
+        if func is not None:
+            try:
+                func(sftp_client, *args)
+            except ParserError:
+                pass
+            if command in CACHE_INVALIDATING_COMMANDS:
+                console_interactor.clear_cache()
+        elif (command in BUILTINS and args) or command == "help":
+            # help has no handler, so as with the old match it always ends up here
+            console.print(f"[red]{command}: too many args[/red]")
+        elif command == "pwd":
+            console.print(f"[bold cyan]{console_interactor.cwd}[/bold cyan]")
+        elif command in ("exit", "quit"):
+            raise typer.Exit()
+        else:
+            console.print(f"Unrecognized command: {user_input}")
 
         if history_file:
             readline.write_history_file(history_file)
 
-    raise RuntimeError("Unreachable code")
 
+# channel flow control defaults, sized for high-latency links
+DEFAULT_WINDOW_SIZE = 4 * 1024 * 1024
+DEFAULT_MAX_PACKET_SIZE = 256 * 1024
 
-@app.command()
-def main(connection_str: str):
-    url = TypeAdapter(SftpUrl).validate_python(connection_str)
-    password = url.password or getpass.getpass("password: ")
-    with SSHClient() as client:
-        client.load_system_host_keys()
-        client.set_missing_host_key_policy(WarningPolicy())
+
+_URL_ADAPTER = TypeAdapter(SftpUrl)
+
+
+def _connect(url: SftpUrl, password: str, compress: bool = False) -> SSHClient:
+    client = SSHClient()
+    client.load_system_host_keys()
+    client.set_missing_host_key_policy(WarningPolicy())
+    try:
         client.connect(
             hostname=url.host,
             port=url.port or 22,
             username=url.username,
             password=password,
+            compress=compress,
         )
+    except BaseException:
+        client.close()
+        raise
+    return client
+
+
+@app.command()
+def main(
+    connection_str: str,
+    sessions: Annotated[
+        int, typer.Option(min=1, help="Number of SFTP sessions used for transfers")
+    ] = 4,
+    window_size: Annotated[
+        int, typer.Option(help="SFTP channel window size in bytes")
+    ] = DEFAULT_WINDOW_SIZE,
+    max_packet_size: Annotated[
+        int, typer.Option(help="SFTP channel maximum packet size in bytes")
+    ] = DEFAULT_MAX_PACKET_SIZE,
+    compress: Annotated[
+        bool, typer.Option(help="Compress the SSH connections, for compressible data")
+    ] = False,
+):
+    url = _URL_ADAPTER.validate_python(connection_str)
+    password = url.password or getpass.getpass("password: ")
+    with _connect(url, password, compress) as client:
         print(f"Connected to {url.host}:{url.port or 22} as {url.username}")
-        return _repl_main(client.open_sftp(), url)
+
+        def _open_pooled_session() -> SFTPClient:
+            pooled_client = _connect(url, password, compress)
+            try:
+                return open_sftp(pooled_client, window_size, max_packet_size)
+            except BaseException:
+                pooled_client.close()
+                raise
+
+        def _report_connect_error(ex: Exception):
+            console.print(
+                f"[red]Could not open an extra SFTP session, "
+                f"continuing without it: {ex}[/red]"
+            )
+
+        pool = SftpClientPool(_open_pooled_session, sessions, _report_connect_error)
+        try:
+            return _repl_main(
+                open_sftp(client, window_size, max_packet_size), url, pool
+            )
+        finally:
+            pool.close()
 
 
 if __name__ == "__main__":
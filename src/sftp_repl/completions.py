@@ -1,9 +1,12 @@
+import bisect
+import operator
 import os
 import shlex
 import stat
 import sys
+import time
 from dataclasses import dataclass, field
-from pathlib import PurePosixPath, Path
+from pathlib import Path
 from typing import Sequence
 
 import readline
@@ -18,18 +21,22 @@ if readline.backend != "readline":
 from paramiko import SFTPAttributes, SFTPClient
 from rich.console import Console
 from rich.columns import Columns
+from rich.text import Text
 
-from sftp_repl.utils import SftpUrl
+from sftp_repl.utils import DIR_STYLE, SftpUrl
+
+# file type bits of st_mode, what stat.S_IFMT masks with
+_S_IFMT = 0o170000
 
 
 def is_dir(sftp_attr: SFTPAttributes) -> bool:
-    return stat.S_IFMT(sftp_attr.st_mode) == stat.S_IFDIR
+    return sftp_attr.st_mode & _S_IFMT == stat.S_IFDIR
 
 
-def format_completion(sftp_attr: SFTPAttributes):
+def format_completion(sftp_attr: SFTPAttributes) -> Text:
     if is_dir(sftp_attr):
-        return f"[bold cyan]{sftp_attr.filename}/[/bold cyan]"
-    return f"{sftp_attr.filename}"
+        return Text(f"{sftp_attr.filename}/", style=DIR_STYLE)
+    return Text(sftp_attr.filename)
 
 
 def format_completion_no_color(sftp_attr: SFTPAttributes):
@@ -38,7 +45,7 @@ def format_completion_no_color(sftp_attr: SFTPAttributes):
     return f"{sftp_attr.filename}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Token:
     text: str
     start: int
@@ -46,32 +53,46 @@ class Token:
 
 
 def tokenize(line: str) -> list[Token]:
-    str_tokens = shlex.split(line)
+    lexer = shlex.shlex(line, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
     tokens = []
-    start = 0
-    for token in str_tokens:
-        start = line[start:].find(token) + start
-        end = start + len(token)
-        tokens.append(Token(text=token, start=start, end=end))
+    while True:
+        start = lexer.instream.tell()
+        text = lexer.get_token()
+        if text is None:
+            break
+        end = lexer.instream.tell()
+        # the lexer consumes the whitespace character that ends a token
+        if lexer.state == " ":
+            end -= 1
+        raw = line[start:end]
+        start += len(raw) - len(raw.lstrip(lexer.whitespace))
+        tokens.append(Token(text=text, start=start, end=end))
     return tokens
 
 
 def locate_full_token(tokens: list[Token], begin: int, end: int):
-    for token in tokens:
-        if begin >= token.start and begin <= token.end:
-            assert end <= token.end, "End of token is expected to be within the token"
-            return token
-    assert False, "unreachable code"
+    # tokens are ordered and disjoint, so only the last one starting at or
+    # before begin can contain it
+    index = bisect.bisect_right(tokens, begin, key=lambda t: t.start) - 1
+    assert index >= 0 and begin <= tokens[index].end, "unreachable code"
+    token = tokens[index]
+    assert end <= token.end, "End of token is expected to be within the token"
+    return token
+
+
+# seconds a listing may be served from the directory cache
+CACHE_TTL = 5.0
 
 
 @dataclass
 class DirectoryCache:
     sftp_client: SFTPClient
-    _files_by_directory: dict[PurePosixPath, list[SFTPAttributes]] = field(
-        default_factory=dict
-    )
-    _files_by_fullname: dict[PurePosixPath, SFTPAttributes] = field(
-        default_factory=dict
+    ttl: float = CACHE_TTL
+    # listed time, entries sorted by filename, and their filenames for bisect
+    _files_by_directory: dict[str, tuple[float, list[SFTPAttributes], list[str]]] = (
+        field(default_factory=dict)
     )
     _cwd: str | None = None
 
@@ -81,31 +102,33 @@ class DirectoryCache:
             self._cwd = self.sftp_client.getcwd()
         return self._cwd
 
-    def listdir(self, path: PurePosixPath):
-        if path not in self._files_by_directory:
+    def _is_fresh(self, path: str) -> bool:
+        entry = self._files_by_directory.get(path)
+        return entry is not None and time.monotonic() - entry[0] < self.ttl
+
+    def _listing(self, path: str) -> tuple[float, list[SFTPAttributes], list[str]]:
+        if not self._is_fresh(path):
             try:
-                self._files_by_directory[path] = self.sftp_client.listdir_attr(
-                    str(path)
-                )
+                # READDIR requests are pipelined, unlike listdir_attr's
+                files = list(self.sftp_client.listdir_iter(path))
             except IOError:
-                self._files_by_directory[path] = []
+                files = []
+            files.sort(key=operator.attrgetter("filename"))
+            names = [f.filename for f in files]
+            self._files_by_directory[path] = (time.monotonic(), files, names)
         return self._files_by_directory[path]
 
-    def is_directory(self, path: PurePosixPath) -> bool:
-        if path in self._files_by_directory:
-            return True
-        if path.parent in self._files_by_directory:
-            for file in self._files_by_directory[path.parent]:
-                if file.filename == path.name:
-                    return is_dir(file)
+    def listdir(self, path: str) -> list[SFTPAttributes]:
+        return self._listing(path)[1]
 
-        if path not in self._files_by_fullname:
-            try:
-                sftp_attr = self.sftp_client.stat(str(path))
-            except IOError:
-                return False
-            self._files_by_fullname[path] = sftp_attr
-        return is_dir(self._files_by_fullname[path])
+    def files_starting_with(self, path: str, prefix: str) -> list[SFTPAttributes]:
+        _, files, names = self._listing(path)
+        # the matches are a contiguous run of the sorted names
+        start = bisect.bisect_left(names, prefix)
+        end = start
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return files[start:end]
 
 
 @dataclass
@@ -114,6 +137,11 @@ class ConsoleInteractor:
     sftp_client: SFTPClient
     url: SftpUrl
     _directory_cache: DirectoryCache = None
+    _prompt_cwd: str | None = None
+    _rendered_prompt: str = ""
+    _completions: list[str] = field(default_factory=list)
+    _tokenized_line: str | None = None
+    _tokens: list[Token] = field(default_factory=list)
 
     def __post_init__(self):
         self._directory_cache = DirectoryCache(self.sftp_client)
@@ -134,9 +162,13 @@ class ConsoleInteractor:
         return f"[green]{self.url.username}@{self.url.host}[/green]:[blue]{self.cwd}[/blue] > "
 
     def get_input(self):
-        with self.console.capture() as capture:
-            self.console.print(self.ps1, end="")
-        return input(capture.get())
+        # the prompt only changes with the working directory, so only render
+        # it again after a cd
+        if self.cwd != self._prompt_cwd:
+            with self.console.capture() as capture:
+                self.console.print(self.ps1, end="")
+            self._prompt_cwd, self._rendered_prompt = self.cwd, capture.get()
+        return input(self._rendered_prompt)
 
     def completion_display_matches_hook(
         self, substitution: str, matches: Sequence[str], longest_match_length: int
@@ -146,35 +178,36 @@ class ConsoleInteractor:
         ]
         self.console.print()
         self.console.print(Columns(formatted_matches, padding=(0, 4)), end="", sep="")
-        self.console.print(self.ps1, readline.get_line_buffer(), end="", sep="")
+        # redraw the prompt rendered by get_input, the typed line is printed
+        # as is rather than parsed as markup
+        self.console.file.write(self._rendered_prompt + readline.get_line_buffer())
+        self.console.file.flush()
         readline.redisplay()
 
     def complete(self, text, state):
-        possible_completions = sorted(self.file_completions_for_text(text))
+        # readline calls this once per candidate with an increasing state,
+        # starting from 0, so only compute the candidates on the first call
+        if state == 0:
+            self._completions = sorted(self.file_completions_for_text(text))
+        possible_completions = self._completions
         if state >= len(possible_completions):
             return None
         return possible_completions[state]
 
     def file_completions_for_text(self, text):
         line = readline.get_line_buffer()
-        tokens = tokenize(line)
+        # repeated tab presses on an unchanged line reuse its tokens
+        if line != self._tokenized_line:
+            self._tokenized_line, self._tokens = line, tokenize(line)
+        tokens = self._tokens
         token = locate_full_token(tokens, readline.get_begidx(), readline.get_endidx())
 
-        path = PurePosixPath(token.text)
-        if text == "":
-            parent, name = path, ""
-        else:
-            parent, name = path.parent, path.name
-
-        if not self.directory_cache.is_directory(parent):
-            return []
+        head, sep, name = token.text.rpartition("/")
+        parent = (head or "/") if sep else "."
 
-        files = self.directory_cache.listdir(parent)
-        self.match_attr_cache = {
-            format_completion_no_color(f): f
-            for f in files
-            if f.filename.startswith(name)
-        }
+        # a failed listing (missing path or not a directory) caches as empty
+        files = self.directory_cache.files_starting_with(parent, name)
+        self.match_attr_cache = {format_completion_no_color(f): f for f in files}
         return list(self.match_attr_cache.keys())
 
 
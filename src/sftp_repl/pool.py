@@ -0,0 +1,131 @@
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import PurePath, PurePosixPath
+from queue import Empty, SimpleQueue
+from typing import Callable, Iterator, TypeVar
+
+from paramiko import SFTPClient, SSHClient, SSHException
+
+T = TypeVar("T")
+
+
+class SessionUnavailable(ConnectionError):
+    """The pool has no session and could not open one."""
+
+
+@dataclass
+class SftpClientPool:
+    """Up to ``size`` SFTP sessions, each on its own SSH connection.
+
+    Sessions are opened with ``connect`` the first time they are needed, so
+    commands working on a single file never pay for the extra connections.
+    Separate connections keep concurrent transfers from sharing one
+    transport's window and packet processing thread.
+
+    When a session fails to open, the pool stops growing and carries on with
+    the sessions it has; ``on_connect_error`` is told about the first failure.
+    """
+
+    connect: Callable[[], SFTPClient]
+    size: int
+    on_connect_error: Callable[[Exception], None] | None = None
+    clients: list[SFTPClient] = field(default_factory=list)
+    connect_error: Exception | None = None
+    _idle: SimpleQueue = field(default_factory=SimpleQueue)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _opened: int = 0
+
+    @contextmanager
+    def checkout(self) -> Iterator[SFTPClient]:
+        try:
+            client = self._idle.get_nowait()
+        except Empty:
+            client = self._open_or_wait()
+        try:
+            yield client
+        finally:
+            self._idle.put(client)
+
+    def warm(self) -> bool:
+        """Make sure a session is open before work is spread over the pool.
+
+        ``False`` means none could be opened, so the work should stay on the
+        caller's own session.
+        """
+        try:
+            with self.checkout():
+                return True
+        except SessionUnavailable:
+            return False
+
+    def _open_or_wait(self) -> SFTPClient:
+        with self._lock:
+            can_open = self._opened < self.size
+            if can_open:
+                # claim the slot now, the connection is made outside the lock
+                self._opened += 1
+        if can_open and (client := self._try_connect()) is not None:
+            return client
+        with self._lock:
+            if not self._opened:
+                raise SessionUnavailable("no SFTP session could be opened")
+        return self._idle.get()
+
+    def _try_connect(self) -> SFTPClient | None:
+        try:
+            client = self.connect()
+        except (SSHException, OSError) as ex:
+            with self._lock:
+                self._opened -= 1
+                # stop growing, the sessions already open carry on
+                self.size = self._opened
+                first_failure = self.connect_error is None
+                self.connect_error = ex
+            if first_failure and self.on_connect_error is not None:
+                self.on_connect_error(ex)
+            return None
+        except BaseException:
+            with self._lock:
+                self._opened -= 1
+            raise
+        self.clients.append(client)
+        return client
+
+    def run(self, operation: Callable[[SFTPClient], T]) -> T:
+        with self.checkout() as client:
+            return operation(client)
+
+    def close(self):
+        for client in self.clients:
+            client.close()
+            client.get_channel().get_transport().close()
+
+
+def open_sftp(
+    ssh_client: SSHClient,
+    window_size: int | None = None,
+    max_packet_size: int | None = None,
+) -> SFTPClient:
+    """Open an SFTP session with explicit channel flow control settings.
+
+    ``None`` falls back to the paramiko transport defaults.
+    """
+    return SFTPClient.from_transport(
+        ssh_client.get_transport(),
+        window_size=window_size,
+        max_packet_size=max_packet_size,
+    )
+
+
+def absolute_remote_path(sftp_client: SFTPClient, path: PurePath | str) -> str:
+    """Resolve ``path`` against the working directory of ``sftp_client``.
+
+    The working directory is tracked client side by paramiko, so paths handed
+    to another session in the pool have to be made absolute first.
+    """
+    cwd = sftp_client.getcwd()
+    if cwd is None:
+        return str(path)
+    # remote paths are always posix, whatever the local platform
+    return str(PurePosixPath(cwd) / path)
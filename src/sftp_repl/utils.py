@@ -1,77 +1,94 @@
-import functools
 import stat
 import time
+from contextlib import contextmanager
 from typing import Annotated
 
 from paramiko.sftp_attr import SFTPAttributes
 from pydantic import AnyUrl, UrlConstraints
 from rich.console import Console
+from rich.style import Style
+from rich.text import Text
 
 SftpUrl = Annotated[AnyUrl, UrlConstraints(allowed_schemes=["sftp"])]
 
+# file type -> (long listing type character, display style)
+_KIND_MAP = {
+    stat.S_IFIFO: ("p", "default"),
+    stat.S_IFCHR: ("c", "default"),
+    stat.S_IFDIR: ("d", "bold cyan"),
+    stat.S_IFBLK: ("b", "default"),
+    stat.S_IFREG: ("-", "default"),
+    stat.S_IFLNK: ("l", "purple"),
+    stat.S_IFSOCK: ("s", "default"),
+}
+_UNKNOWN_KIND = ("?", "default")
 
-def format_name(name: str, sftp_attr: SFTPAttributes) -> str:
-    kind = stat.S_IFMT(sftp_attr.st_mode)
-    # filename = getattr(sftp_attr, "filename", "?")
-    filename = name
-    if kind == stat.S_IFDIR:
-        return f"[bold cyan]{filename}/[/bold cyan]"
-    if kind == stat.S_IFLNK:
-        return f"[purple]{filename}[/purple]"
-    return filename
+
+DIR_STYLE = Style(color="cyan", bold=True)
+LINK_STYLE = Style(color="purple")
+
+# file type -> (name suffix, style) for names that are not displayed plainly
+_NAME_STYLES = {
+    stat.S_IFDIR: ("/", DIR_STYLE),
+    stat.S_IFLNK: ("", LINK_STYLE),
+}
+_PLAIN_NAME = ("", "")
+
+
+def format_name(name: str, sftp_attr: SFTPAttributes) -> Text:
+    suffix, style = _NAME_STYLES.get(stat.S_IFMT(sftp_attr.st_mode), _PLAIN_NAME)
+    return Text(name + suffix, style=style)
+
+
+_SIZE_UNITS = ("B", "K", "M", "G", "T")
 
 
 def human_readable_size(size: int) -> str:
     """Convert a size in bytes to a human-readable format."""
     if size < 1024:
-        ssize, label = size, "B"
-    elif size < 1024**2:
-        ssize, label = size / 1024, "K"
-    elif size < 1024**3:
-        ssize, label = size / (1024**2), "M"
-    elif size < 1024**4:
-        ssize, label = size / (1024**3), "G"
-    else:
-        ssize, label = size / (1024**4), "T"
+        return f"{size}B"
 
-    if ssize > 10.0 or size < 1024:
+    # bit_length gives the integer log base 1024 without comparing each power
+    shift = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    ssize, label = size / (1 << (10 * shift)), _SIZE_UNITS[shift]
+    if ssize > 10.0:
         return f"{ssize:.0f}{label}"
     return f"{ssize:.1f}{label}"
 
 
-def long_listing(name: str, sftp_attr, human_readable=False) -> str:
+def _permissions(mode: int) -> str:
+    rwx = SFTPAttributes._rwx
+    return "".join(
+        (
+            rwx((mode & 0o700) >> 6, mode & stat.S_ISUID),
+            rwx((mode & 0o70) >> 3, mode & stat.S_ISGID),
+            rwx(mode & 7, mode & stat.S_ISVTX, True),
+        )
+    )
+
+
+# "rwxr-xr-x" style permission strings, indexed by the permission bits of a mode
+_PERMISSIONS = tuple(_permissions(mode) for mode in range(0o10000))
+
+_LONG_LISTING_FORMAT = "{perms}   1 {uid:<8d} {gid:<8d} {size:>8s} {date:<12s} "
+
+
+def long_listing(
+    name: str,
+    sftp_attr: SFTPAttributes,
+    human_readable: bool = False,
+    now: float | None = None,
+) -> Text:
     """create a unix-style long description of the file (like ls -l).
 
-    Copied from paramiko and updated
+    Copied from paramiko and updated. Pass ``now`` to share one clock reading
+    across a whole listing.
     """
 
     if sftp_attr.st_mode is not None:
-        kind = stat.S_IFMT(sftp_attr.st_mode)
-        if kind == stat.S_IFIFO:
-            ks, file_colo = "p", "default"
-        elif kind == stat.S_IFCHR:
-            ks, file_colo = "c", "default"
-        elif kind == stat.S_IFDIR:
-            ks, file_colo = "d", "bold cyan"
-        elif kind == stat.S_IFBLK:
-            ks, file_colo = "b", "default"
-        elif kind == stat.S_IFREG:
-            ks, file_colo = "-", "default"
-        elif kind == stat.S_IFLNK:
-            ks, file_colo = "l", "purple"
-        elif kind == stat.S_IFSOCK:
-            ks, file_colo = "s", "default"
-        else:
-            ks, file_colo = "?", "default"
-        ks += sftp_attr._rwx(
-            (sftp_attr.st_mode & 0o700) >> 6, sftp_attr.st_mode & stat.S_ISUID
-        )
-        ks += sftp_attr._rwx(
-            (sftp_attr.st_mode & 0o70) >> 3, sftp_attr.st_mode & stat.S_ISGID
-        )
-        ks += sftp_attr._rwx(
-            sftp_attr.st_mode & 7, sftp_attr.st_mode & stat.S_ISVTX, True
-        )
+        mode = sftp_attr.st_mode
+        kind_char, file_colo = _KIND_MAP.get(stat.S_IFMT(mode), _UNKNOWN_KIND)
+        ks = kind_char + _PERMISSIONS[mode & 0o7777]
     else:
         ks, file_colo = "?---------", "default"
     # compute display date
@@ -80,7 +97,9 @@ def long_listing(name: str, sftp_attr, human_readable=False) -> str:
         datestr = "(unknown date)"
     else:
         time_tuple = time.localtime(sftp_attr.st_mtime)
-        if abs(time.time() - sftp_attr.st_mtime) > 15_552_000:
+        if now is None:
+            now = time.time()
+        if abs(now - sftp_attr.st_mtime) > 15_552_000:
             # (15,552,000s = 6 months)
             datestr = time.strftime("%d %b %Y", time_tuple)
         else:
@@ -97,29 +116,22 @@ def long_listing(name: str, sftp_attr, human_readable=False) -> str:
         gid = 0
     if size is None:
         size = 0
-    if human_readable:
-        size_str = human_readable_size(size)
-
-        return f"{ks}   1 {uid:<8d} {gid:<8d} {size_str:>8s} {datestr:12s} {filename}"
-    return "%s   1 %-8d %-8d %8d %-12s %s" % (
-        ks,
-        uid,
-        gid,
-        size,
-        datestr,
+    size_str = human_readable_size(size) if human_readable else str(size)
+    return Text.assemble(
+        _LONG_LISTING_FORMAT.format(
+            perms=ks, uid=uid, gid=gid, size=size_str, date=datestr
+        ),
         filename,
     )
 
 
-def handle_io_error(console: Console):
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*a, **k):
-            try:
-                return func(*a, **k)
-            except IOError as ex:
-                console.print(f"[red]{ex}[/red]")
+@contextmanager
+def handle_io_error(console: Console, path: str | None = None):
+    """Print an IOError instead of raising it, after ``path`` if one is given.
 
-        return wrapper
-
-    return decorator
+    Usable around a block or, like any ``contextmanager``, as a decorator.
+    """
+    try:
+        yield
+    except IOError as ex:
+        console.print(f"[red]{path}: {ex}[/red]" if path else f"[red]{ex}[/red]")